@@ -1,38 +1,94 @@
+import os
+
 import requests
 import pandas as pd
 import streamlit as st
 
-from io import StringIO
+from config import DATA_COLUMNS, DATA_DTYPES
+
+# Madrid open data portal endpoint for the events dataset
+MADRID_EVENTS_URL = "https://datos.madrid.es/egob/catalogo/300107-0-agenda-actividades-eventos.csv"
+
+# Local columnar cache revalidated against the API via ETag
+CACHE_DIR = "./cache"
+PARQUET_PATH = os.path.join(CACHE_DIR, "events.parquet")
+ETAG_PATH = os.path.join(CACHE_DIR, "events.etag")
+
+
+def _read_cached_etag():
+    """Return the ETag stored with the local Parquet cache, if any."""
+    try:
+        with open(ETAG_PATH) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_parquet_cache(df, etag):
+    """Persist the DataFrame as Parquet together with its ETag."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    df.to_parquet(PARQUET_PATH, compression='zstd')
+    if etag:
+        with open(ETAG_PATH, 'w') as f:
+            f.write(etag)
+
 
-@st.cache_data
+@st.cache_resource(ttl=3600)
 def load_madrid_events_data():
     """
-    Load Madrid events data from the API and return as DataFrame
+    Load Madrid events data from the API.
+
+    The CSV is persisted locally as a compressed Parquet artifact; on
+    subsequent loads the API is revalidated with ``If-None-Match`` so a
+    304 response skips the download and the CSV re-parse entirely.
+
+    Returns:
+        (DataFrame, error) tuple; error is None on success. Failures are
+        reported back instead of rendered here because the search page
+        runs this in a worker thread, where Streamlit elements have no
+        ScriptRunContext and would be dropped.
     """
     try:
-        url = "https://datos.madrid.es/egob/catalogo/300107-0-agenda-actividades-eventos.csv"
-        
-        # Make request to the API
         headers = {'Accept': 'text/csv'}
-        response = requests.get(url, headers=headers)
+        etag = _read_cached_etag()
+        if etag and os.path.exists(PARQUET_PATH):
+            headers['If-None-Match'] = etag
+
+        # Make request to the API, streaming the body into the parser
+        response = requests.get(MADRID_EVENTS_URL, headers=headers, stream=True)
+
+        if response.status_code == 304:
+            # Upstream unchanged: reuse the columnar cache
+            return pd.read_parquet(PARQUET_PATH, columns=DATA_COLUMNS, memory_map=True), None
+
         response.raise_for_status()  # Raise an exception for bad status codes
-        
+
         # Convert response content to DataFrame
-        csv_content = StringIO(response.text)
-        df = pd.read_csv(csv_content, sep=';')  # Madrid data often uses semicolon separator
-        
-        return df
-    
+        response.raw.decode_content = True
+        df = pd.read_csv(response.raw, sep=';',  # Madrid data often uses semicolon separator
+                         encoding=response.encoding or 'utf-8',
+                         usecols=DATA_COLUMNS,
+                         engine='pyarrow')
+
+        # Arrow parses in parallel but doesn't apply pandas dtypes during
+        # the read; convert the narrow columns afterwards
+        df = df.astype(DATA_DTYPES)
+        df['FECHA'] = pd.to_datetime(df['FECHA'], errors='coerce')
+
+        _write_parquet_cache(df, response.headers.get('ETag'))
+        return df, None
+
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching data from API: {e}")
-        return pd.DataFrame()
+        # Fall back to the last cached artifact when the API is unreachable
+        if os.path.exists(PARQUET_PATH):
+            return pd.read_parquet(PARQUET_PATH, columns=DATA_COLUMNS, memory_map=True), None
+        return pd.DataFrame(), f"Error fetching data from API: {e}"
     except Exception as e:
-        st.error(f"Error processing data: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), f"Error processing data: {e}"
 
 
 if __name__ == "__main__":
-   df = load_madrid_events_data()
+   df, error = load_madrid_events_data()
 
-   print(df.shape)
+   print(error or df.shape)
    print(df.columns)
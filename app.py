@@ -7,7 +7,7 @@ with advanced filtering capabilities and detailed event visualization.
 
 import streamlit as st
 from config import APP_CONFIG
-from resourceManager import load_resources
+from resourceManager import load_resources, resource_version
 
 # Configure Streamlit page
 st.set_page_config(
@@ -21,7 +21,9 @@ st.set_page_config(
 def main():
     """Main application function with multipage navigation."""
     
-    logo = load_resources(APP_CONFIG["logo_path"])
+    # The mtime key invalidates the cached logo only when the file changes
+    logo = load_resources(APP_CONFIG["logo_path"],
+                          mtime=resource_version(APP_CONFIG["logo_path"]))
     st.sidebar.write(logo, unsafe_allow_html=True)
 
     # Define pages
@@ -66,6 +66,31 @@ DATE_FORMATS = {
     'ics': '%Y%m%dT%H%M%SZ'
 }
 
+# Columns of the Madrid events CSV consumed by the application
+DATA_COLUMNS = [
+    ' ID-EVENTO',
+    'TITULO',
+    'DESCRIPCION',
+    'PRECIO',
+    'GRATUITO',
+    'FECHA',
+    'HORA',
+    'DISTRITO-INSTALACION',
+    'NOMBRE-INSTALACION',
+    'TIPO',
+    'AUDIENCIA',
+    'CONTENT-URL',
+    'URL-ACTIVIDAD',
+]
+
+# Narrow dtypes for the low-cardinality string columns
+DATA_DTYPES = {
+    'GRATUITO': 'category',
+    'DISTRITO-INSTALACION': 'category',
+    'TIPO': 'category',
+    'NOMBRE-INSTALACION': 'category',
+}
+
 # Field mappings for data processing
 FIELD_MAPPINGS = {
     'csv_to_display': {
@@ -5,242 +5,516 @@ This module provides various chart components for data visualization
 including similarity charts, distribution charts, and analytics.
 """
 
+import numpy as np
 import streamlit as st
-import plotly.express as px
 import pandas as pd
 
+# Content-based cache key so identical result sets reuse cached figures
+_DF_HASH_FUNCS = {
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=False).values.tobytes()
+}
 
-def create_similarity_chart(results_df, key_prefix=""):
+# Shared cache policy for all figure builders
+_cache_figure = st.cache_data(ttl=3600, max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+
+
+def _topk_counts(series, k=8):
     """
-    Create a similarity score chart for search results.
-    
-    Args:
-        results_df (pd.DataFrame): DataFrame containing search results
-        key_prefix (str): Prefix for the chart key to ensure uniqueness
+    Top-k value counts of a column in a single pass.
+
+    ``value_counts(sort=False)`` skips the full sort of the counts and
+    ``nlargest`` heap-selects the k biggest, so the column is scanned
+    once instead of the isna-scan + sorted-value_counts + head pattern.
+    Returns None when the column has no non-null values.
     """
-    if results_df.empty:
-        return
-    
-    fig = px.bar(
-        results_df.head(10),
-        x='similarity_score',
-        y='title',
-        orientation='h',
-        title='Puntuación de Similitud (Top 10)',
-        labels={'similarity_score': 'Puntuación de Similitud', 'title': 'Eventos'},
-        color='similarity_score',
-        color_continuous_scale='viridis'
+    s = series.dropna()
+    if s.empty:
+        return None
+    return s.value_counts(sort=False).nlargest(k)
+
+
+def _normalize_results(results_df):
+    """
+    Materialize derived columns shared by the display helpers.
+
+    Adds int8 ``is_free`` / ``is_paid`` flags and the cleaned type name
+    once per result frame so downstream code reads precomputed columns
+    instead of re-running string comparisons per widget. Idempotent, so
+    both entry points can call it on the same frame.
+    """
+    if results_df.empty or 'is_free' in results_df.columns:
+        return results_df
+
+    free = results_df['free'].astype(str)
+    results_df = results_df.assign(
+        is_free=free.eq('1').astype('int8'),
+        is_paid=free.eq('0').astype('int8'),
     )
-    
+
+    if 'type_clean' not in results_df.columns:
+        # astype(str) first: 'type' may be categorical on result frames
+        results_df = results_df.assign(
+            type_clean=results_df['type'].astype(str).str.rsplit('/', n=1).str[-1]
+        )
+
+    results_df = results_df.assign(
+        details_md=_vector_details(results_df),
+        preview_short=(
+            results_df['description_preview'].fillna('').astype(str).str.slice(0, 100) + '…'
+        ),
+    )
+
+    # One notna reduction replaces the per-chart isna().all() guards
+    guard_cols = ['district', 'type', 'free', 'date', 'similarity_score']
+    results_df.attrs['nonempty'] = results_df[guard_cols].notna().any().to_dict()
+
+    return results_df
+
+
+def _has_values(results_df, column):
+    """Whether a column holds any non-null value, via the precomputed map."""
+    nonempty = results_df.attrs.get('nonempty')
+    if nonempty is not None and column in nonempty:
+        return nonempty[column]
+    return results_df[column].notna().any()
+
+
+def _vector_details(results_df):
+    """Build each row's details markdown line with vectorized string ops."""
+    dates = pd.to_datetime(results_df['date'], errors='coerce').dt.strftime('%d/%m/%Y')
+    date_text = dates.fillna(results_df['date'].fillna('').astype(str))
+
+    parts = [
+        ('📅 ', date_text),
+        ('⏰ ', results_df['time'].fillna('').astype(str)),
+        ('📍 ', results_df['district'].astype(str)),
+        ('🏢 ', results_df['venue'].astype(str)),
+    ]
+
+    # Every non-empty part carries a leading separator; slicing it off
+    # the joined string yields the " • "-delimited line without per-row
+    # list building
+    joined = pd.Series('', index=results_df.index)
+    for prefix, text in parts:
+        joined = joined + np.where(text.ne(''), ' • ' + prefix + text, '')
+
+    return joined.str.slice(3)
+
+
+# Stable widget keys, precomputed once instead of an f-string per rerun.
+# The dashboard variants keep dashboard charts distinct from standalone
+# ones so Streamlit doesn't tear down and rebuild the frontend element.
+_KEYS = {
+    'sim': 'similarity_chart',
+    'dist': 'district_distribution_chart',
+    'type': 'event_type_chart',
+    'free': 'free_vs_paid_chart',
+    'time': 'timeline_chart',
+}
+_DASH_KEYS = {k: f"dashboard_{v}" for k, v in _KEYS.items()}
+
+# theme=None skips Streamlit's theme-injection pass over the figure
+# JSON; the mode bar adds DOM weight without value for these charts
+_PLOTLY_THEME = None
+_PLOTLY_CONFIG = {
+    'displayModeBar': False,
+    'responsive': True,
+    'staticPlot': False,
+}
+
+
+# Sampled viridis palette, filled lazily on the first similarity chart
+_VIRIDIS_LUT = None
+
+
+def _viridis_colors(scores):
+    """Map scores in [0, 1] to RGB strings via a cached 256-entry LUT."""
+    global _VIRIDIS_LUT
+    if _VIRIDIS_LUT is None:
+        import plotly.express as px
+        _VIRIDIS_LUT = np.array(
+            px.colors.sample_colorscale('Viridis', np.linspace(0, 1, 256))
+        )
+    idx = (np.asarray(scores, dtype=np.float64) * 255).astype(np.int32).clip(0, 255)
+    return _VIRIDIS_LUT[idx]
+
+
+@_cache_figure
+def _build_similarity_figure(results_df):
+    """Build the similarity bar figure (cached per result set)."""
+    # Deferred so the app doesn't pay the plotly import unless a chart renders
+    import plotly.graph_objects as go
+
+    top = results_df.head(10)
+    fig = go.Figure(go.Bar(
+        x=top['similarity_score'],
+        y=top['title'],
+        orientation='h',
+        # Precomputed colors skip Plotly's per-figure scale construction
+        marker_color=_viridis_colors(top['similarity_score'].values),
+    ))
+
     fig.update_layout(
+        title='Puntuación de Similitud (Top 10)',
+        xaxis_title='Puntuación de Similitud',
+        yaxis_title='Eventos',
         height=500,
         yaxis={'categoryorder': 'total ascending'},
-        showlegend=False
+        showlegend=False,
+        # Stable uirevision lets Plotly.js diff instead of redrawing
+        uirevision='similarity',
     )
-    
-    st.plotly_chart(fig, use_container_width=True, key="similarity_chart")
+
+    return fig
+
+
+def create_similarity_chart(results_df, key=_KEYS['sim']):
+    """
+    Create a similarity score chart for search results.
+
+    Args:
+        results_df (pd.DataFrame): DataFrame containing search results
+        key (str): Chart widget key, unique per placement
+    """
+    if results_df.empty:
+        return
+
+    st.plotly_chart(_build_similarity_figure(results_df),
+                    use_container_width=True, key=key,
+                    theme=_PLOTLY_THEME, config=_PLOTLY_CONFIG)
 
 
-def create_district_distribution_chart(results_df, key_prefix=""):
+@_cache_figure
+def _build_district_figure(results_df):
+    """Build the district distribution pie figure (cached per result set)."""
+    district_counts = _topk_counts(results_df['district'])
+
+    if district_counts is None:
+        return None
+
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Pie(
+        labels=district_counts.index,
+        values=district_counts.values,
+    ))
+
+    fig.update_layout(title='Distribución por Distritos', height=400,
+                      uirevision='district')
+    return fig
+
+
+def create_district_distribution_chart(results_df, key=_KEYS['dist']):
     """
     Create a district distribution pie chart.
-    
+
     Args:
         results_df (pd.DataFrame): DataFrame containing search results
-        key_prefix (str): Prefix for the chart key to ensure uniqueness
+        key (str): Chart widget key, unique per placement
     """
-    if results_df.empty or results_df['district'].isna().all():
+    if results_df.empty or not _has_values(results_df, 'district'):
         return
-    
-    district_counts = results_df['district'].value_counts().head(8)
-    
-    if len(district_counts) > 0:
-        fig = px.pie(
-            values=district_counts.values,
-            names=district_counts.index,
-            title='Distribución por Distritos'
-        )
-        
-        fig.update_layout(height=400)
-        chart_key = f"{key_prefix}district_distribution_chart" if key_prefix else "district_distribution_chart"
-        st.plotly_chart(fig, use_container_width=True, key=chart_key)
+
+    fig = _build_district_figure(results_df)
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True, key=key,
+                        theme=_PLOTLY_THEME, config=_PLOTLY_CONFIG)
+
+
+@_cache_figure
+def _build_event_type_figure(results_df):
+    """Build the event type bar figure (cached per result set)."""
+    # Clean type names vectorized: last path segment of the type string
+    clean_types = _topk_counts(
+        results_df['type'].dropna().astype(str).str.rsplit('/', n=1).str[-1]
+    )
+
+    if clean_types is None:
+        return None
+
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(
+        x=clean_types.index,
+        y=clean_types.values,
+    ))
+
+    fig.update_layout(
+        title='Tipos de Eventos Más Comunes',
+        xaxis_title='Tipo de Evento',
+        yaxis_title='Cantidad',
+        height=400,
+        xaxis_tickangle=-45,
+        uirevision='types',
+    )
+    return fig
 
 
-def create_event_type_chart(results_df, key_prefix=""):
+def create_event_type_chart(results_df, key=_KEYS['type']):
     """
     Create an event type distribution chart.
-    
+
     Args:
         results_df (pd.DataFrame): DataFrame containing search results
-        key_prefix (str): Prefix for the chart key to ensure uniqueness
+        key (str): Chart widget key, unique per placement
     """
-    if results_df.empty or results_df['type'].isna().all():
+    if results_df.empty or not _has_values(results_df, 'type'):
         return
-    
-    # Clean type names
-    clean_types = results_df['type'].apply(
-        lambda x: x.split('/')[-1] if pd.notna(x) and '/' in x else x
-    ).value_counts().head(8)
-    
-    if len(clean_types) > 0:
-        fig = px.bar(
-            x=clean_types.index,
-            y=clean_types.values,
-            title='Tipos de Eventos Más Comunes',
-            labels={'x': 'Tipo de Evento', 'y': 'Cantidad'}
-        )
-        
-        fig.update_layout(
-            height=400,
-            xaxis_tickangle=-45
-        )
-        chart_key = f"{key_prefix}event_type_chart" if key_prefix else "event_type_chart"
-        st.plotly_chart(fig, use_container_width=True, key=chart_key)
 
+    fig = _build_event_type_figure(results_df)
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True, key=key,
+                        theme=_PLOTLY_THEME, config=_PLOTLY_CONFIG)
+
+
+@_cache_figure
+def _build_free_vs_paid_figure(results_df):
+    """Build the free vs paid pie figure (cached per result set)."""
+    # Precomputed flags from _normalize_results: two int8 reductions
+    # instead of a string value_counts
+    free_events = int(results_df['is_free'].sum())
+    paid_events = int(results_df['is_paid'].sum())
+
+    labels = []
+    values = []
+
+    if free_events:
+        labels.append('Gratuitos')
+        values.append(free_events)
+
+    if paid_events:
+        labels.append('De pago')
+        values.append(paid_events)
+
+    if not labels:
+        return None
+
+    import plotly.graph_objects as go
 
-def create_free_vs_paid_chart(results_df, key_prefix=""):
+    colors = {'Gratuitos': '#28a745', 'De pago': '#ffc107'}
+    fig = go.Figure(go.Pie(
+        labels=labels,
+        values=values,
+        marker={'colors': [colors[label] for label in labels]},
+    ))
+
+    fig.update_layout(title='Distribución Gratuito vs De Pago', height=300,
+                      uirevision='free_vs_paid')
+    return fig
+
+
+def create_free_vs_paid_chart(results_df, key=_KEYS['free']):
     """
     Create a free vs paid events chart.
-    
+
     Args:
         results_df (pd.DataFrame): DataFrame containing search results
-        key_prefix (str): Prefix for the chart key to ensure uniqueness
+        key (str): Chart widget key, unique per placement
     """
-    if results_df.empty or results_df['free'].isna().all():
+    if results_df.empty or not _has_values(results_df, 'free'):
         return
-    
-    free_counts = results_df['free'].value_counts()
-    
-    if len(free_counts) > 0:
-        labels = []
-        values = []
-        
-        if '1' in free_counts.index:
-            labels.append('Gratuitos')
-            values.append(free_counts['1'])
-        
-        if '0' in free_counts.index:
-            labels.append('De pago')
-            values.append(free_counts['0'])
-        
-        if labels:
-            fig = px.pie(
-                values=values,
-                names=labels,
-                title='Distribución Gratuito vs De Pago',
-                color_discrete_map={
-                    'Gratuitos': '#28a745',
-                    'De pago': '#ffc107'
-                }
-            )
-            
-            fig.update_layout(height=300)
-            chart_key = f"{key_prefix}free_vs_paid_chart" if key_prefix else "free_vs_paid_chart"
-            st.plotly_chart(fig, use_container_width=True, key=chart_key)
-
-
-def create_timeline_chart(results_df, key_prefix=""):
+
+    fig = _build_free_vs_paid_figure(results_df)
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True, key=key,
+                        theme=_PLOTLY_THEME, config=_PLOTLY_CONFIG)
+
+
+# Timelines past this many points get downsampled before plotting
+_TIMELINE_MAX_POINTS = 500
+
+
+def _lttb_downsample(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets point selection.
+
+    Returns the indices of the ``n_out`` points that best preserve the
+    visual shape of the series, keeping the first and last point. Small
+    inline implementation — the series here are short enough that a
+    dedicated downsampling dependency is not warranted.
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1, dtype=np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+
+        # Mean of the following bucket acts as the third triangle vertex
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+        else:
+            nlo, nhi = edges[i + 1], n
+        cx = x[nlo:nhi].mean()
+        cy = y[nlo:nhi].mean()
+
+        areas = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(areas.argmax())
+        out[i + 1] = a
+
+    return out
+
+
+@_cache_figure
+def _build_timeline_figure(results_df):
+    """Build the events-per-date line figure (cached per result set)."""
+    # Parse only the date column — no full-frame copy; the parse itself
+    # is amortized by the figure-level cache
+    dates = pd.to_datetime(results_df['date'], errors='coerce').dropna()
+
+    if dates.empty:
+        return None
+
+    date_counts = dates.dt.date.value_counts().sort_index()
+
+    if len(date_counts) > _TIMELINE_MAX_POINTS:
+        xs = pd.DatetimeIndex(date_counts.index).asi8.astype(np.float64)
+        ys = date_counts.values.astype(np.float64)
+        keep = _lttb_downsample(xs, ys, _TIMELINE_MAX_POINTS)
+        date_counts = date_counts.iloc[keep]
+
+    import plotly.graph_objects as go
+
+    # Scattergl rasterizes on the GPU instead of the browser's SVG
+    # layout engine, which degrades past ~1k points
+    fig = go.Figure(go.Scattergl(
+        x=date_counts.index,
+        y=date_counts.values,
+        mode='lines+markers',
+    ))
+
+    fig.update_layout(
+        title='Eventos por Fecha',
+        xaxis_title='Fecha',
+        yaxis_title='Número de Eventos',
+        height=400,
+        uirevision='timeline',
+    )
+    return fig
+
+
+def create_timeline_chart(results_df, key=_KEYS['time']):
     """
     Create a timeline chart showing events by date.
-    
+
     Args:
         results_df (pd.DataFrame): DataFrame containing search results
-        key_prefix (str): Prefix for the chart key to ensure uniqueness
+        key (str): Chart widget key, unique per placement
     """
-    if results_df.empty or results_df['date'].isna().all():
+    if results_df.empty or not _has_values(results_df, 'date'):
         return
-    
-    # Convert dates and group by date
-    results_df_copy = results_df.copy()
-    results_df_copy['date'] = pd.to_datetime(results_df_copy['date'], errors='coerce')
-    results_df_copy = results_df_copy.dropna(subset=['date'])
-    
-    if results_df_copy.empty:
-        return
-    
-    date_counts = results_df_copy.groupby(results_df_copy['date'].dt.date).size().reset_index()
-    date_counts.columns = ['fecha', 'cantidad']
-    
-    if len(date_counts) > 0:
-        fig = px.line(
-            date_counts,
-            x='fecha',
-            y='cantidad',
-            title='Eventos por Fecha',
-            labels={'fecha': 'Fecha', 'cantidad': 'Número de Eventos'}, 
-            markers=True
-        )
-        
-        fig.update_layout(height=400)
-        chart_key = f"{key_prefix}timeline_chart" if key_prefix else "timeline_chart"
-        st.plotly_chart(fig, use_container_width=True, key=chart_key)
+
+    fig = _build_timeline_figure(results_df)
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True, key=key,
+                        theme=_PLOTLY_THEME, config=_PLOTLY_CONFIG)
+
+
+@_cache_figure
+def _summary_metrics(results_df):
+    """Compute the four summary metrics (cached per result set)."""
+    return (
+        len(results_df),
+        results_df['similarity_score'].mean(),
+        int(results_df['is_free'].sum()),
+        results_df['district'].nunique(),
+    )
 
 
 def display_summary_metrics(results_df):
     """
     Display summary metrics for search results.
-    
+
     Args:
         results_df (pd.DataFrame): DataFrame containing search results
     """
     if results_df.empty:
         return
-    
+
+    total_events, avg_similarity, free_events, unique_districts = _summary_metrics(results_df)
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        total_events = len(results_df)
         st.metric("📊 Total Eventos", total_events)
-    
+
     with col2:
-        avg_similarity = results_df['similarity_score'].mean()
         st.metric("🎯 Similitud Promedio", f"{avg_similarity:.1%}")
-    
+
     with col3:
-        free_events = len(results_df[results_df['free'] == '1'])
         st.metric("💚 Eventos Gratuitos", free_events)
-    
+
     with col4:
-        unique_districts = results_df['district'].nunique()
         st.metric("🗺️ Distritos", unique_districts)
 
 
+# Each tab body is a fragment so interactions inside one tab rerun only
+# that tab instead of the whole script
+
+@st.fragment
+def _tab_similarity(results_df):
+    create_similarity_chart(results_df, key=_DASH_KEYS['sim'])
+
+
+@st.fragment
+def _tab_districts(results_df):
+    create_district_distribution_chart(results_df, key=_DASH_KEYS['dist'])
+
+
+@st.fragment
+def _tab_types(results_df):
+    col1, col2 = st.columns(2)
+    with col1:
+        create_event_type_chart(results_df, key=_DASH_KEYS['type'])
+    with col2:
+        create_free_vs_paid_chart(results_df, key=_DASH_KEYS['free'])
+
+
+@st.fragment
+def _tab_timeline(results_df):
+    create_timeline_chart(results_df, key=_DASH_KEYS['time'])
+
+
 def render_analytics_dashboard(results_df):
     """
     Render a complete analytics dashboard.
-    
+
     Args:
         results_df (pd.DataFrame): DataFrame containing search results
     """
     if results_df.empty:
         st.warning("No hay datos para mostrar en el dashboard.")
         return
-    
+
+    results_df = _normalize_results(results_df)
+
     st.markdown("### 📊 Dashboard de Análisis")
-    
+
     # Summary metrics
     display_summary_metrics(results_df)
-    
+
     # Charts in tabs
     tab1, tab2, tab3, tab4 = st.tabs([
-        "📈 Similitud", 
-        "🗺️ Distritos", 
-        "🏷️ Tipos", 
+        "📈 Similitud",
+        "🗺️ Distritos",
+        "🏷️ Tipos",
         "📅 Timeline"
     ])
-    
+
     with tab1:
-        create_similarity_chart(results_df, key_prefix="dashboard_")
-    
+        _tab_similarity(results_df)
+
     with tab2:
-        create_district_distribution_chart(results_df, key_prefix="dashboard_")
-    
+        _tab_districts(results_df)
+
     with tab3:
-        col1, col2 = st.columns(2)
-        with col1:
-            create_event_type_chart(results_df, key_prefix="dashboard_")
-        with col2:
-            create_free_vs_paid_chart(results_df, key_prefix="dashboard_")
-    
+        _tab_types(results_df)
+
     with tab4:
-        create_timeline_chart(results_df, key_prefix="dashboard_")
+        _tab_timeline(results_df)
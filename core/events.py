@@ -5,15 +5,29 @@ This module provides the detailed event view with comprehensive information
 display and calendar export functionality.
 """
 
+from functools import lru_cache
+
 import streamlit as st
 import pandas as pd
 from .calendar_export import (
-    create_calendar_export_links, 
+    create_calendar_export_links,
     generate_ics_content,
     render_calendar_export_buttons
 )
 
 
+@lru_cache(maxsize=4096)
+def _parse_event_date(value):
+    """
+    Parse a date string once per session.
+
+    Repeated renders of the same event hit the cache instead of
+    re-running pandas' format inference; unparseable input comes back
+    as NaT rather than raising.
+    """
+    return pd.to_datetime(value, errors='coerce')
+
+
 def display_event_detail(event_data):
     """
     Display detailed view of a selected event.
@@ -29,96 +43,76 @@ def display_event_detail(event_data):
         
         # Main content in columns
         col1, col2 = st.columns([2, 1])
-        
+
         with col1:
-            _render_event_description(event_data)
-            _render_event_datetime(event_data)
-            _render_event_location(event_data)
-            _render_event_type(event_data)
-            _render_event_price(event_data)
-            _render_event_links(event_data)
-        
+            # One element (and one front-end delta) for the whole column
+            st.markdown(_build_event_body(event_data))
+
         with col2:
             _render_similarity_score(event_data)
             _render_calendar_export_section(event_data)
 
 
-def _render_event_description(event_data):
-    """Render event description section."""
-    if event_data.get('description_preview'):
-        st.markdown("**📝 Descripción:**")
-        st.markdown(event_data['description_preview'])
-        st.markdown("---")
+def _build_event_body(event_data):
+    """
+    Build the full left-column markdown for an event.
 
+    Merges the description, datetime, location, type, price and link
+    sections into one string so the detail view emits a single markdown
+    element instead of one per line.
+    """
+    sections = []
 
-def _render_event_datetime(event_data):
-    """Render event date and time section."""
-    st.markdown("**📅 Fecha y hora:**")
-    date_time_info = []
-    
+    # Description
+    if event_data.get('description_preview'):
+        sections.append(f"**📝 Descripción:**\n\n{event_data['description_preview']}")
+
+    # Date and time
+    date_part = ''
     if event_data.get('date'):
-        try:
-            date_obj = pd.to_datetime(event_data['date'])
-            date_time_info.append(f"📅 {date_obj.strftime('%A, %d de %B de %Y')}")
-        except Exception:
-            date_time_info.append(f"📅 {event_data['date']}")
-    
-    if event_data.get('time'):
-        date_time_info.append(f"⏰ {event_data['time']}")
-    
-    if date_time_info:
-        st.markdown(" • ".join(date_time_info))
-    else:
-        st.markdown("⚠️ Fecha no especificada")
-    
-    st.markdown("---")
+        date_obj = _parse_event_date(event_data['date'])
+        if pd.notna(date_obj):
+            date_part = f"📅 {date_obj.strftime('%A, %d de %B de %Y')}"
+        else:
+            date_part = f"📅 {event_data['date']}"
 
+    time_part = f"⏰ {event_data['time']}" if event_data.get('time') else ''
+
+    if date_part or time_part:
+        sep = ' • ' if date_part and time_part else ''
+        datetime_line = f"{date_part}{sep}{time_part}"
+    else:
+        datetime_line = "⚠️ Fecha no especificada"
+    sections.append(f"**📅 Fecha y hora:**\n\n{datetime_line}")
 
-def _render_event_location(event_data):
-    """Render event location section."""
-    st.markdown("**📍 Ubicación:**")
+    # Location
     location_info = []
-    
     if event_data.get('venue'):
         location_info.append(f"🏢 {event_data['venue']}")
     if event_data.get('district'):
         location_info.append(f"🗺️ {event_data['district']}")
-    
-    if location_info:
-        st.markdown(" • ".join(location_info))
-    else:
-        st.markdown("⚠️ Ubicación no especificada")
-    
-    st.markdown("---")
-
+    location_line = " • ".join(location_info) if location_info else "⚠️ Ubicación no especificada"
+    sections.append(f"**📍 Ubicación:**\n\n{location_line}")
 
-def _render_event_type(event_data):
-    """Render event type section."""
+    # Event type
     if event_data.get('type'):
-        st.markdown("**🏷️ Tipo de evento:**")
         type_clean = event_data['type'].split('/')[-1] if '/' in event_data['type'] else event_data['type']
-        st.markdown(type_clean)
-        st.markdown("---")
+        sections.append(f"**🏷️ Tipo de evento:**\n\n{type_clean}")
 
-
-def _render_event_price(event_data):
-    """Render event price section."""
-    st.markdown("**💰 Precio:**")
+    # Price
     if event_data.get('free') == '1':
-        st.markdown("💚 **Gratuito**")
+        price_line = "💚 **Gratuito**"
     elif event_data.get('free') == '0':
-        st.markdown("💰 **De pago**")
+        price_line = "💰 **De pago**"
     else:
-        st.markdown("ℹ️ Consultar precio")
-    
-    st.markdown("---")
+        price_line = "ℹ️ Consultar precio"
+    sections.append(f"**💰 Precio:**\n\n{price_line}")
 
-
-def _render_event_links(event_data):
-    """Render external links section."""
+    # External links
     if event_data.get('url'):
-        st.markdown("**🔗 Enlaces:**")
-        st.markdown(f"[📄 Información oficial]({event_data['url']})")
+        sections.append(f"**🔗 Enlaces:**\n\n[📄 Información oficial]({event_data['url']})")
+
+    return "\n\n---\n\n".join(sections)
 
 
 def _render_similarity_score(event_data):
@@ -128,19 +122,47 @@ def _render_similarity_score(event_data):
         st.metric("🎯 Similitud", f"{similarity_pct:.1f}%")
 
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_calendar_exports(title, date, time, venue, district, description, url):
+    """
+    Build provider links and ICS content once per distinct event.
+
+    Keyed on the fields that affect the output, so reruns of the detail
+    view resolve to a cache lookup instead of re-encoding URLs and
+    re-serializing the ICS payload.
+    """
+    event_data = {
+        'title': title,
+        'date': date,
+        'time': time,
+        'venue': venue,
+        'district': district,
+        'description_preview': description,
+        'url': url,
+    }
+    return create_calendar_export_links(event_data), generate_ics_content(event_data)
+
+
 def _render_calendar_export_section(event_data):
     """Render calendar export section."""
     st.markdown("### 📅 Añadir al Calendario")
-    
-    calendar_links = create_calendar_export_links(event_data)
-    
+
+    calendar_links, ics_content = _cached_calendar_exports(
+        event_data.get('title', ''),
+        event_data.get('date', ''),
+        event_data.get('time', ''),
+        event_data.get('venue', ''),
+        event_data.get('district', ''),
+        event_data.get('description_preview', ''),
+        event_data.get('url', ''),
+    )
+
     # Calendar export buttons in a more compact layout
     calendar_buttons_html = render_calendar_export_buttons(calendar_links)
     st.markdown(calendar_buttons_html, unsafe_allow_html=True)
-    
+
     # ICS file download (iCalendar format)
     st.markdown("---")
-    ics_content = generate_ics_content(event_data)
     st.download_button(
         label="💾 Descargar .ics",
         data=ics_content,
@@ -164,15 +186,18 @@ def display_event_preview(event_data, show_export_button=True):
         st.markdown(f"**{event_data.get('title', 'Evento sin título')}**")
         
         if event_data.get('description_preview'):
-            st.markdown(f"📝 {event_data['description_preview'][:100]}...")
+            # Fast path: the truncated preview is precomputed on search
+            # result rows; slice only for events arriving without it
+            preview = event_data.get('preview_short') or f"{event_data['description_preview'][:100]}…"
+            st.markdown(f"📝 {preview}")
         
         # Basic details in one line
         details = []
         if event_data.get('date'):
-            try:
-                date_obj = pd.to_datetime(event_data['date'])
+            date_obj = _parse_event_date(event_data['date'])
+            if pd.notna(date_obj):
                 details.append(f"📅 {date_obj.strftime('%d/%m/%Y')}")
-            except Exception:
+            else:
                 details.append(f"📅 {event_data['date']}")
         
         if event_data.get('time'):
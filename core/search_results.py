@@ -7,7 +7,7 @@ and quick actions for events.
 
 import streamlit as st
 import pandas as pd
-from .calendar_export import create_calendar_export_links, render_quick_calendar_button
+from .charts import _topk_counts, _normalize_results, _DF_HASH_FUNCS
 
 
 def navigate_to_event_detail(event_data):
@@ -34,6 +34,8 @@ def display_search_results(results_df, query):
         st.warning("🔍 No se encontraron eventos similares para la búsqueda.")
         return
 
+    results_df = _normalize_results(results_df)
+
     _render_results_header(results_df, query)
     _render_results_list(results_df)
 
@@ -45,186 +47,128 @@ def _render_results_header(results_df, query):
     
 
 
-def _render_results_list(results_df):
-    """Render the list of search results."""
-    for idx, row in results_df.iterrows():
-        _render_single_result(row, idx)
-        st.divider()
+# Column layout for the results table, built once at import time
+_RESULT_COLUMNS = {
+    'rank': '#',
+    'title': 'Evento',
+    'similarity_score': 'Similitud',
+    'type_clean': 'Tipo',
+    'details_md': 'Detalles',
+    'url': 'Enlace',
+}
 
 
-def _render_single_result(row, idx):
-    """
-    Render a single search result item.
-    
-    Args:
-        row (pd.Series): Single row from results DataFrame
-        idx (int): Index for unique key generation
+def _render_results_list(results_df):
     """
-    with st.container():
-        col1, col2, col3 = st.columns([3, 1, 1])
-        
-        with col1:
-            _render_result_main_content(row, idx)
-        
-        with col2:
-            _render_result_metrics(row)
-        
-        with col3:
-            _render_result_actions(row)
+    Render the results as a single selectable dataframe.
 
-
-def _render_result_main_content(row, idx):
-    """Render the main content of a search result."""
-    # Make title clickable with better styling
-    title_text = f"**{row['rank']}. {row['title']}**"
-    
-    # Create a more prominent clickable title
-    col_title, col_icon = st.columns([4, 1])
-    
-    with col_title:
-        if st.button(
-            title_text, 
-            key=f"event_{idx}", 
-            help="Click para ver detalles completos del evento",
-            use_container_width=True
-        ):
-            # Store the selected event in session state and navigate to detail page
-            st.session_state.selected_event = row.to_dict()
-            try:
-                st.switch_page("pages/event_detail.py")
-            except Exception as e:
-                st.error(f"Error navegando: {e}")
-                # Fallback: use session state flag
-                st.session_state.navigate_to_detail = True
-                st.rerun()
-    
-    with col_icon:
-        st.markdown("👁️", help="Ver detalles")
-    
-    # Description preview
-    if row.get('description_preview'):
-        st.markdown(f"📝 {row['description_preview']}")
-    
-    # Event details
-    details = _build_event_details(row)
-    if details:
-        st.markdown(" • ".join(details))
-    
-    # URL link
-    if row.get('url'):
-        st.markdown(f"[🔗 Más info]({row['url']})")
-
-
-def _build_event_details(row):
-    """Build the details list for an event."""
-    details = []
-    
-    if row.get('date'):
+    One virtualized table element replaces the previous
+    container-per-row layout (3 columns + button + markdown each);
+    selecting a row opens the event detail page.
+    """
+    view_df = results_df[list(_RESULT_COLUMNS)]
+
+    selection = st.dataframe(
+        view_df,
+        column_config={
+            'rank': st.column_config.NumberColumn(_RESULT_COLUMNS['rank'], width='small'),
+            'title': st.column_config.TextColumn(_RESULT_COLUMNS['title'], width='large'),
+            'similarity_score': st.column_config.ProgressColumn(
+                _RESULT_COLUMNS['similarity_score'], min_value=0.0, max_value=1.0
+            ),
+            'type_clean': st.column_config.TextColumn(_RESULT_COLUMNS['type_clean']),
+            'details_md': st.column_config.TextColumn(_RESULT_COLUMNS['details_md']),
+            'url': st.column_config.LinkColumn(
+                _RESULT_COLUMNS['url'], display_text="🔗 Más info"
+            ),
+        },
+        hide_index=True,
+        use_container_width=True,
+        selection_mode='single-row',
+        on_select='rerun',
+        key='search_results_table',
+    )
+
+    st.caption("👁️ Selecciona una fila para ver los detalles completos del evento")
+
+    selected_rows = selection.selection.rows
+    if selected_rows:
+        # Store the selected event in session state and navigate to detail page
+        st.session_state.selected_event = results_df.iloc[selected_rows[0]].to_dict()
         try:
-            date_obj = pd.to_datetime(row['date'])
-            details.append(f"📅 {date_obj.strftime('%d/%m/%Y')}")
-        except Exception:
-            details.append(f"📅 {row['date']}")
-    
-    if row.get('time'):
-        details.append(f"⏰ {row['time']}")
-    
-    if row.get('district'):
-        details.append(f"📍 {row['district']}")
-    
-    if row.get('venue'):
-        details.append(f"🏢 {row['venue']}")
-    
-    return details
-
-
-def _render_result_metrics(row):
-    """Render metrics for a search result."""
-    # Similarity score
-    similarity_pct = row['similarity_score'] * 100
-    st.metric("Similitud", f"{similarity_pct:.1f}%")
-    
-    # Free/Paid indicator
-    if row.get('free') == '1':
-        st.markdown("💚 **Gratuito**")
-    elif row.get('free') == '0':
-        st.markdown("💰 **De pago**")
-
-
-def _render_result_actions(row):
-    """Render action buttons for a search result."""
-    # Event type
-    if row.get('type'):
-        type_clean = row['type'].split('/')[-1] if '/' in row['type'] else row['type']
-        st.markdown(f"🏷️ **{type_clean}**")
-    
-    
-    # Quick calendar export button
-    st.markdown("---")
-    calendar_links = create_calendar_export_links(row.to_dict())
-    quick_button_html = render_quick_calendar_button(calendar_links)
-    st.markdown(quick_button_html, unsafe_allow_html=True)
+            st.switch_page("pages/event_detail.py")
+        except Exception as e:
+            st.error(f"Error navegando: {e}")
+            # Fallback: use session state flag
+            st.session_state.navigate_to_detail = True
+            st.rerun()
+
+
+@st.cache_data(ttl=3600, max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _summary_aggregates(results_df):
+    """Compute every summary aggregate in one cached pass per result set."""
+    return (
+        results_df['similarity_score'].mean(),
+        _topk_counts(results_df['district'], k=5),
+        _topk_counts(results_df['type_clean'], k=5),
+        int(results_df['is_free'].sum()),
+        int(results_df['is_paid'].sum()),
+    )
 
 
 def display_search_summary(results_df):
     """
     Display a summary of search results.
-    
+
     Args:
         results_df (pd.DataFrame): DataFrame containing search results
     """
     if results_df.empty:
         return
-    
+
+    results_df = _normalize_results(results_df)
+
     st.markdown("### 📈 Resumen de Resultados")
-    
+
+    avg_similarity, district_counts, type_counts, free_count, paid_count = \
+        _summary_aggregates(results_df)
+
     # Average similarity
-    avg_similarity = results_df['similarity_score'].mean()
     st.metric("Similitud Promedio", f"{avg_similarity:.2%}")
-    
+
     # District distribution
-    _display_district_summary(results_df)
-    
+    _display_district_summary(district_counts)
+
     # Type distribution
-    _display_type_summary(results_df)
-    
+    _display_type_summary(type_counts)
+
     # Free vs Paid
-    _display_price_summary(results_df)
+    _display_price_summary(free_count, paid_count)
 
 
-def _display_district_summary(results_df):
+def _display_district_summary(district_counts):
     """Display district distribution summary."""
-    if not results_df['district'].isna().all():
-        district_counts = results_df['district'].value_counts().head(5)
-        if len(district_counts) > 0:
-            st.markdown("**🗺️ Distritos más relevantes:**")
-            for district, count in district_counts.items():
-                st.markdown(f"• {district}: {count} eventos")
+    if district_counts is not None:
+        st.markdown("**🗺️ Distritos más relevantes:**")
+        for district, count in district_counts.items():
+            st.markdown(f"• {district}: {count} eventos")
 
 
-def _display_type_summary(results_df):
+def _display_type_summary(type_counts):
     """Display event type distribution summary."""
-    if not results_df['type'].isna().all():
-        type_counts = results_df['type'].apply(
-            lambda x: x.split('/')[-1] if pd.notna(x) and '/' in x else x
-        ).value_counts().head(5)
-        if len(type_counts) > 0:
-            st.markdown("**🏷️ Tipos más comunes:**")
-            for event_type, count in type_counts.items():
-                if pd.notna(event_type):
-                    st.markdown(f"• {event_type}: {count} eventos")
-
-
-def _display_price_summary(results_df):
+    if type_counts is not None:
+        st.markdown("**🏷️ Tipos más comunes:**")
+        for event_type, count in type_counts.items():
+            if pd.notna(event_type):
+                st.markdown(f"• {event_type}: {count} eventos")
+
+
+def _display_price_summary(free_count, paid_count):
     """Display price distribution summary."""
-    if not results_df['free'].isna().all():
-        free_counts = results_df['free'].value_counts()
-        if len(free_counts) > 0:
-            st.markdown("**💰 Distribución de precios:**")
-            free_count = free_counts.get('1', 0)
-            paid_count = free_counts.get('0', 0)
-            st.markdown(f"• Gratuitos: {free_count}")
-            st.markdown(f"• De pago: {paid_count}")
+    if free_count or paid_count:
+        st.markdown("**💰 Distribución de precios:**")
+        st.markdown(f"• Gratuitos: {free_count}")
+        st.markdown(f"• De pago: {paid_count}")
 
 
 def display_no_results_message(query):
@@ -5,17 +5,106 @@ This module provides functionality to create and query an embedding database
 for event descriptions using ChromaDB and efficient Spanish language models.
 """
 
+import os
 import re
 import sys
-import pysqlite3 as sqlite3
-sys.modules['sqlite3'] = sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    # ChromaDB needs a newer sqlite3 than some hosts ship; swap in the
+    # pysqlite3 binary when available, fall back to the stdlib otherwise
+    import pysqlite3 as sqlite3
+    sys.modules['sqlite3'] = sqlite3
+except ImportError:
+    pass
 
 import chromadb
+import joblib
+import numpy as np
 import pandas as pd
+import torch
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 from typing import  Dict, Any, Optional
 
+from config import SEARCH_CONFIG
+
+def _epoch_day(value) -> int:
+    """Days since the Unix epoch for a date-like value."""
+    return (pd.Timestamp(value) - pd.Timestamp(0)).days
+
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length (in place when possible)."""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    np.clip(norms, 1e-12, None, out=norms)
+    return embeddings / norms
+
+
+# Cleaning patterns compiled once at import instead of per call. HTML
+# tags and URLs share one alternation so stripping them is a single
+# scan; whitespace collapsing stays separate (different replacement).
+_WS = re.compile(r'\s+')
+_MARKUP = re.compile(r'<[^>]+>|https?://\S+')
+
+
+class OnnxEmbedder:
+    """
+    CPU embedding backend on ONNX Runtime with int8 dynamic quantization.
+
+    ONNX Runtime removes most of the PyTorch dispatch overhead on CPU
+    and int8 weights let VNNI-capable cores use 8-bit dot products.
+    Exposes the subset of the SentenceTransformer encode API the manager
+    uses. Requires the optional ``optimum[onnxruntime]`` extra.
+    """
+
+    def __init__(self, model_name: str, cache_dir: str = "./onnx_model"):
+        try:
+            from transformers import AutoTokenizer
+            from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        except ImportError as exc:
+            raise ImportError(
+                "The 'onnx' backend needs optimum[onnxruntime]; "
+                "install it or use backend='torch'"
+            ) from exc
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        quantized_name = "model_quantized.onnx"
+        if not os.path.exists(os.path.join(cache_dir, quantized_name)):
+            # Export once, quantize once; later runs load from cache_dir
+            model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+            model.save_pretrained(cache_dir)
+            quantizer = ORTQuantizer.from_pretrained(cache_dir)
+            quantizer.quantize(
+                save_dir=cache_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False)
+            )
+
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            cache_dir, file_name=quantized_name
+        )
+
+    def encode(self, texts, batch_size: int = 256, **kwargs) -> np.ndarray:
+        """Mean-pooled embeddings, padded per micro-batch."""
+        outputs = []
+        for start in range(0, len(texts), batch_size):
+            batch = list(texts[start:start + batch_size])
+            encoded = self.tokenizer(
+                batch, padding="longest", truncation=True, return_tensors="np"
+            )
+            hidden = self.model(**encoded).last_hidden_state
+            mask = encoded["attention_mask"][:, :, None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            outputs.append(pooled)
+
+        # Unit vectors, matching normalize_embeddings=True on the torch
+        # backend, so the inner-product index reads as cosine similarity
+        return _l2_normalize(np.vstack(outputs).astype(np.float32, copy=False))
+
 
 class EventEmbeddingManager:
     """
@@ -27,22 +116,60 @@ class EventEmbeddingManager:
         self, 
         db_path: str = "./chroma_db",
         collection_name: str = "event_descriptions",
-        model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+        model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        pca_components: Optional[int] = None,
+        device: Optional[str] = None,
+        fp16: bool = True,
+        backend: str = "torch"
     ):
         """
         Initialize the Event Embedding Manager.
-        
+
         Args:
             db_path: Path to ChromaDB storage directory
             collection_name: Name for the ChromaDB collection
             model_name: HuggingFace model name for embeddings
                        Default uses multilingual model optimized for Spanish
+            pca_components: Optional target dimension; when set, a PCA
+                            projection is fitted at ingest and stored
+                            vectors (and queries) are reduced to it
+            device: Torch device for the model; defaults to CUDA when
+                    available, CPU otherwise
+            fp16: Run the model in half precision on CUDA devices
+            backend: "torch" (default) or "onnx" for the quantized
+                     ONNX Runtime CPU path
         """
         self.db_path = db_path
         self.collection_name = collection_name
         self.model_name = model_name
-        
-        self.model = SentenceTransformer(self.model_name)
+        self.pca_components = pca_components
+        self.backend = backend
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+
+        if backend == "onnx":
+            self.model = OnnxEmbedder(self.model_name)
+            self._use_fp16 = False
+        else:
+            self.model = SentenceTransformer(self.model_name, device=self.device)
+
+            # MiniLM encode is compute-bound; FP16 roughly doubles tensor
+            # throughput on modern GPUs and halves activation bandwidth
+            self._use_fp16 = fp16 and self.device.startswith("cuda")
+            if self._use_fp16:
+                self.model.half()
+
+        # Bounded per-instance LRU: Streamlit reruns re-issue the same
+        # query on every widget change, so repeats skip the transformer
+        # forward. A lock guards it because sessions run in separate
+        # threads against the shared cached manager.
+        self._emb_cache: OrderedDict = OrderedDict()
+        self._emb_cache_max = 512
+        self._emb_cache_lock = threading.Lock()
+
+        # Reuse the PCA projection persisted by a previous ingest so
+        # query vectors match the reduced space of the stored vectors
+        self._pca_path = os.path.join(db_path, "pca.joblib")
+        self._pca = joblib.load(self._pca_path) if os.path.exists(self._pca_path) else None
         
         self.client = chromadb.PersistentClient(
             path=self.db_path,
@@ -60,14 +187,35 @@ class EventEmbeddingManager:
         try:
             self.collection = self.client.get_collection(
                 name=self.collection_name,
-                embedding_function=None 
+                embedding_function=None
             )
+
+            # Stores built before the filterable-metadata series lack
+            # date_epoch (and type_clean/preview). Every query now
+            # carries a date_epoch condition and Chroma excludes
+            # documents missing the field, so such a store would answer
+            # every search with nothing — and the skip-existing ingest
+            # check would never backfill it. Drop it; the caller
+            # re-ingests into the fresh collection.
+            peeked = self.collection.peek(limit=1).get('metadatas') or []
+            if peeked and 'date_epoch' not in peeked[0]:
+                self.client.delete_collection(name=self.collection_name)
+                self._init_collection()
         except Exception:
             self.collection = self.client.create_collection(
                 name=self.collection_name,
                 embedding_function=None,
                 metadata={"description": "Event descriptions embeddings for MadLife",
-                          "hnsw:space": "cosine"}
+                          # Vectors are stored L2-normalized, so inner
+                          # product equals cosine while skipping the
+                          # per-comparison norm work of the cosine kernel
+                          "hnsw:space": "ip",
+                          # Tuned for a small corpus: a narrower graph (M)
+                          # with generous ef keeps recall high at low latency
+                          "hnsw:M": 16,
+                          "hnsw:construction_ef": 200,
+                          "hnsw:search_ef": 100,
+                          "hnsw:batch_size": 100}
             )
     
     def _clean_text(self, text: str) -> str:
@@ -82,154 +230,333 @@ class EventEmbeddingManager:
         """
         if pd.isna(text) or not text:
             return ""
-        
-        # Convert to string and strip
-        text = str(text).strip()
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove HTML tags if any
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        return text
-    
-    def _prepare_event_text(self, event_row: pd.Series) -> str:
+
+        # Strip markup and URLs in one scan, then collapse whitespace
+        text = _MARKUP.sub('', str(text))
+        text = _WS.sub(' ', text)
+
+        return text.strip()
+
+    @staticmethod
+    def _clean_series(series: pd.Series) -> pd.Series:
+        """Vectorized counterpart of _clean_text for a whole column."""
+        # Object cast before the fill: categoricals (TIPO, DISTRITO-
+        # INSTALACION) reject fillna with a value outside their
+        # categories, and astype(str) alone would stringify NaN as 'nan'
+        return (
+            series.astype(object).fillna('').astype(str)
+            .str.replace(_MARKUP, '', regex=True)
+            .str.replace(_WS, ' ', regex=True)
+            .str.strip()
+        )
+
+    def _prepare_event_texts(self, df: pd.DataFrame) -> pd.Series:
         """
-        Combine relevant event fields into a single text for embedding.
-        
-        Args:
-            event_row: Pandas series representing an event
-            
-        Returns:
-            Combined text representation of the event
+        Build the combined embedding text for every event at once.
+
+        The cleaning and field concatenation run as column operations
+        instead of a Python loop over rows.
         """
-        title = self._clean_text(event_row.get('TITULO', ''))
-        description = self._clean_text(event_row.get('DESCRIPCION', ''))
-        tipo = self._clean_text(event_row.get('TIPO', ''))
-        district = self._clean_text(event_row.get('DISTRITO-INSTALACION', ''))
-        
-        # Combine fields with appropriate weights
-        combined_text = f"{title}"
-        if description:
-            combined_text += f". {description}"
-        if tipo:
-            tipo_clean = tipo.split('/')[-1] if '/' in tipo else tipo
-            combined_text += f". Categoría: {tipo_clean}"
-        if district:
-            combined_text += f". Distrito: {district}"
-            
-        return combined_text.strip()
+        title = self._clean_series(df['TITULO'])
+        description = self._clean_series(df['DESCRIPCION'])
+        tipo = self._clean_series(df['TIPO']).str.rsplit('/', n=1).str[-1]
+        district = self._clean_series(df['DISTRITO-INSTALACION'])
+
+        combined = (
+            title
+            + np.where(description.ne(''), '. ' + description, '')
+            + np.where(tipo.ne(''), '. Categoría: ' + tipo, '')
+            + np.where(district.ne(''), '. Distrito: ' + district, '')
+        )
+        return combined.str.strip()
     
-    def add_events(self, df: pd.DataFrame, batch_size: int = 100) -> int:
+    def _encode(self, texts, **kwargs) -> np.ndarray:
+        """
+        Encode texts under inference mode, with FP16 autocast on CUDA.
+
+        Embeddings come out L2-normalized so the inner-product index
+        scores them as cosine similarity. Outputs are cast back to
+        float32 so ChromaDB always stores full-precision vectors
+        regardless of the compute dtype.
+        """
+        if self.backend == "onnx":
+            return self.model.encode(texts, **kwargs)
+
+        with torch.inference_mode():
+            if self._use_fp16:
+                with torch.autocast("cuda", dtype=torch.float16):
+                    embeddings = self.model.encode(
+                        texts, convert_to_numpy=True,
+                        normalize_embeddings=True, **kwargs
+                    )
+            else:
+                embeddings = self.model.encode(
+                    texts, convert_to_numpy=True,
+                    normalize_embeddings=True, **kwargs
+                )
+
+        return embeddings.astype(np.float32, copy=False)
+
+    def _encode_query(self, clean_query: str) -> np.ndarray:
+        """
+        Encode one query text through the bounded embedding LRU.
+
+        A tokenized-prefix cache as in KV reuse schemes does not map
+        onto the SentenceTransformer encode API, so whole-query
+        embeddings are the cached unit.
+        """
+        with self._emb_cache_lock:
+            cached = self._emb_cache.get(clean_query)
+            if cached is not None:
+                self._emb_cache.move_to_end(clean_query)
+                return cached
+
+        embedding = self._encode([clean_query])
+
+        with self._emb_cache_lock:
+            self._emb_cache[clean_query] = embedding
+            self._emb_cache.move_to_end(clean_query)
+            if len(self._emb_cache) > self._emb_cache_max:
+                self._emb_cache.popitem(last=False)
+
+        return embedding
+
+    def add_events(self, df: pd.DataFrame, batch_size: int = 250) -> int:
         """
         Add events to the embedding database.
-        
+
+        All texts are encoded in a single call so sentence-transformers
+        can length-sort internally and the per-call tokenizer and model
+        launch overhead is paid once for the whole ingest; vectors are
+        then streamed to ChromaDB in fixed-size chunks.
+
         Args:
             df: DataFrame containing event data
-            batch_size: Number of events to process in each batch
-            
+            batch_size: Number of events per collection.add chunk
+
         Returns:
             Number of events successfully added
         """
-        
+
         if len(df) == 0:
             return 0
-                
-        added_count = 0
-        
-        for i in range(0, len(df), batch_size):
-            batch = df.iloc[i:i + batch_size]
-            
-            # Prepare texts and metadata
-            texts = []
-            ids = []
-            metadatas = []
-            
-            for idx, row in batch.iterrows():
-                # Create combined text
-                text = self._prepare_event_text(row)
-                if not text:
-                    continue
-                    
-                texts.append(text)
-                ids.append(str(row[' ID-EVENTO']))
-                
-                # Prepare metadata
-                metadata = {
-                    'title': row.get('TITULO', ''),
-                    'price': str(row.get('PRECIO', '')),
-                    'free': str(row.get('GRATUITO', '')),
-                    'date': str(row.get('FECHA', '')),
-                    'time': str(row.get('HORA', '')),
-                    'district': str(row.get('DISTRITO-INSTALACION', '')),
-                    'venue': str(row.get('NOMBRE-INSTALACION', '')),
-                    'type': str(row.get('TIPO', '')),
-                    'audience': str(row.get('AUDIENCIA', '')),
-                    'url': str(row.get('URL-ACTIVIDAD', ''))
-                }
-                metadatas.append(metadata)
-            
-            if texts:
-                embeddings = self.model.encode(texts, show_progress_bar=True)
-                
-                self.collection.add(
-                    embeddings=embeddings.tolist(),
-                    documents=texts,
-                    metadatas=metadatas,
-                    ids=ids
+
+        preview_len = SEARCH_CONFIG['default_description_length']
+
+        # Combined texts built vectorized for the whole frame up front;
+        # rows whose text comes out empty are dropped
+        all_texts = self._prepare_event_texts(df)
+        all_ids = df[' ID-EVENTO'].astype(str)
+        mask = all_texts.ne('').to_numpy()
+
+        if mask.any():
+            # One bulk existence check makes reruns idempotent: rows
+            # already in the collection skip encoding entirely, so an
+            # ingest of unchanged data costs a single get
+            existing = set(self.collection.get(
+                ids=all_ids.to_numpy()[mask].tolist(), include=[]
+            )['ids'])
+            if existing:
+                mask &= ~all_ids.isin(existing).to_numpy()
+
+        if not mask.any():
+            return 0
+
+        kept_texts = all_texts[mask]
+        texts = kept_texts.tolist()
+        ids = all_ids.to_numpy()[mask].tolist()
+
+        # Metadata as a columnar rename + records conversion — no
+        # per-row Series construction
+        meta_cols = {
+            'TITULO': 'title',
+            'PRECIO': 'price',
+            'GRATUITO': 'free',
+            'FECHA': 'date',
+            'HORA': 'time',
+            'DISTRITO-INSTALACION': 'district',
+            'NOMBRE-INSTALACION': 'venue',
+            'TIPO': 'type',
+            'AUDIENCIA': 'audience',
+            'URL-ACTIVIDAD': 'url',
+        }
+        # Object cast before the fill: the categorical columns reject
+        # fillna with a value outside their categories, and filling
+        # after astype(str) would leave 'nan' strings behind
+        meta_df = (
+            df.loc[mask, list(meta_cols)]
+            .astype(object).fillna('').astype(str)
+            .rename(columns=meta_cols)
+        )
+
+        # Cleaned type stored alongside the raw path so the sidebar's
+        # type filter can be matched with $eq inside the where clause
+        meta_df['type_clean'] = meta_df['type'].str.rsplit('/', n=1).str[-1]
+
+        dates = pd.to_datetime(df.loc[mask, 'FECHA'], errors='coerce')
+
+        # FECHA is datetime, which the string fill above passes through
+        # untouched; stringify it explicitly so NaT stores as '' rather
+        # than leaking a 'NaT' literal into the date metadata
+        meta_df['date'] = dates.dt.strftime('%Y-%m-%d %H:%M:%S').fillna('')
+
+        # Epoch-day ints let the date range run as a where condition;
+        # -1 marks unknown dates, outside any requested range
+        meta_df['date_epoch'] = (
+            (dates - pd.Timestamp(0)).dt.days.fillna(-1).astype('int64')
+        )
+
+        # Truncated once here so display never re-slices
+        previews = kept_texts.str.slice(0, preview_len)
+        meta_df['preview'] = np.where(
+            kept_texts.str.len() > preview_len, previews + '…', previews
+        )
+
+        metadatas = meta_df.to_dict('records')
+
+        # Length-sorted input keeps each encode batch padded to similar
+        # lengths (character count as a cheap token proxy); the inverse
+        # permutation restores frame order before the ingest
+        order = np.argsort([len(t) for t in texts])
+        sorted_texts = [texts[i] for i in order]
+
+        if self.backend == "torch" and self.device == "cpu" and len(texts) > 5000:
+            # First-time builds on CPU boxes are the worst user-visible
+            # wait; one worker per core scales the encode near-linearly.
+            # Fork overhead makes the pool a loss on small ingests, so
+            # those stay on the single-process path below.
+            worker_pool = self.model.start_multi_process_pool(
+                ['cpu'] * os.cpu_count()
+            )
+            try:
+                embeddings = self.model.encode_multi_process(
+                    sorted_texts, worker_pool, batch_size=64
                 )
-                
-                added_count += len(texts)
-        
-        return added_count
+            finally:
+                self.model.stop_multi_process_pool(worker_pool)
+            # Workers skip the normalization applied in _encode
+            embeddings = _l2_normalize(embeddings.astype(np.float32, copy=False))
+        else:
+            # tqdm's per-batch flush/lock overhead is measurable on
+            # short CPU encodes, so the bar only appears for sizeable
+            # ingests
+            embeddings = self._encode(
+                sorted_texts,
+                batch_size=256,
+                show_progress_bar=len(texts) > 512
+            )
+        embeddings = embeddings[np.argsort(order)]
+
+        # Fit the projection on the full ingest before storing anything
+        if self.pca_components and self._pca is None:
+            self._fit_pca(embeddings)
+        if self._pca is not None:
+            # transform comes back float64; shrink to the float32 Chroma
+            # stores anyway, halving the payload handed over. The
+            # projection also breaks the unit norm, so restore it for
+            # the inner-product index.
+            embeddings = _l2_normalize(np.ascontiguousarray(
+                self._pca.transform(embeddings), dtype=np.float32
+            ))
+
+        # ndarray slices go to Chroma as-is — no O(N·D) Python float
+        # boxing through tolist(). Writes are serialization-heavy, so a
+        # small pool keeps one chunk pickling while another lands in the
+        # index; the encode itself already ran in one pass above.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(
+                    self.collection.add,
+                    embeddings=embeddings[start:start + batch_size],
+                    documents=texts[start:start + batch_size],
+                    metadatas=metadatas[start:start + batch_size],
+                    ids=ids[start:start + batch_size]
+                )
+                for start in range(0, len(texts), batch_size)
+            ]
+            # Surface the first write failure instead of dropping it
+            for future in as_completed(futures):
+                future.result()
+
+        return len(texts)
+
+    def _fit_pca(self, embeddings: np.ndarray):
+        """Fit and persist the PCA projection used to shrink stored vectors."""
+        from sklearn.decomposition import PCA
+
+        n_components = min(self.pca_components, *embeddings.shape)
+        self._pca = PCA(n_components=n_components).fit(embeddings)
+        joblib.dump(self._pca, self._pca_path)
     
     def search_similar_events(
         self, 
-        query: str, 
+        query: str,
         n_results: int = 10,
         include_distances: bool = True,
-        filter_metadata: Optional[Dict[str, Any]] = None
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        date_since=None,
+        date_to=None
     ) -> Dict[str, Any]:
         """
         Search for events similar to the given query.
-        
+
         Args:
             query: Search query in natural language
             n_results: Number of similar events to return
             include_distances: Whether to include similarity distances
             filter_metadata: Optional metadata filters
-            
+            date_since: Optional start of the date range (inclusive)
+            date_to: Optional end of the date range (inclusive)
+
         Returns:
             Dictionary containing search results
         """
         if not query or not query.strip():
-            return {"results": [], "distances": [], "metadatas": []}
-        
+            return {"event_ids": [], "distances": [], "metadatas": []}
+
         clean_query = self._clean_text(query)
-        
-        query_embedding = self.model.encode([clean_query])
-        
-        where_clause = None
+
+        query_embedding = self._encode_query(clean_query)
+
+        if self._pca is not None:
+            query_embedding = _l2_normalize(np.ascontiguousarray(
+                self._pca.transform(query_embedding), dtype=np.float32
+            ))
+
+        conditions = []
         if filter_metadata:
-            where_clause = {}
-            for key, value in filter_metadata.items():
-                if value:
-                    where_clause[key] = {"$eq": str(value)}
+            conditions.extend(
+                {key: {"$eq": str(value)}}
+                for key, value in filter_metadata.items()
+                if value
+            )
+
+        # The date range compares against the epoch-day ints stored at
+        # ingest, so no result row needs datetime parsing
+        if date_since is not None:
+            conditions.append({"date_epoch": {"$gte": _epoch_day(date_since)}})
+        if date_to is not None:
+            conditions.append({"date_epoch": {"$lte": _epoch_day(date_to)}})
+
+        where_clause = None
+        if len(conditions) == 1:
+            where_clause = conditions[0]
+        elif conditions:
+            # Chroma requires an explicit $and for multiple conditions
+            where_clause = {"$and": conditions}
         
+        # Documents stay in the store: everything the UI shows lives in
+        # the metadata (including the truncated preview written at
+        # ingest), so the full texts never leave Chroma on queries
         results = self.collection.query(
-            query_embeddings=query_embedding.tolist(),
+            query_embeddings=query_embedding,
             n_results=n_results,
             where=where_clause,
-            include=['documents', 'metadatas', 'distances']
+            include=['metadatas', 'distances']
         )
-        
+
         formatted_results = {
             'query': query,
-            'results': results.get('documents', [[]])[0],
             'metadatas': results.get('metadatas', [[]])[0],
             'event_ids': results.get('ids', [[]])[0],
             'distances': results.get('distances', [[]])[0] if include_distances else None
@@ -267,40 +594,52 @@ class EventEmbeddingManager:
             return False
     
     def export_similar_events_df(
-        self, 
-        query: str, 
-        n_results: int = 10
+        self,
+        query: str,
+        n_results: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        date_since=None,
+        date_to=None
     ) -> pd.DataFrame:
         """
         Search for similar events and return results as a DataFrame.
-        
+
         Args:
             query: Search query
             n_results: Number of results to return
-            
+            filter_metadata: Optional metadata filters pushed into the
+                             Chroma where clause
+            date_since: Optional start of the date range (inclusive)
+            date_to: Optional end of the date range (inclusive)
+
         Returns:
             DataFrame with search results
         """
-        results = self.search_similar_events(query, n_results, include_distances=True)
+        results = self.search_similar_events(
+            query, n_results, include_distances=True,
+            filter_metadata=filter_metadata,
+            date_since=date_since, date_to=date_to
+        )
         
-        if not results['results']:
+        if not results['event_ids']:
             return pd.DataFrame()
-        
+
         # Create DataFrame from results
         data = []
-        for i, (doc, metadata, event_id, distance) in enumerate(zip(
-            results['results'], 
-            results['metadatas'], 
-            results['event_ids'], 
+        for i, (metadata, event_id, distance) in enumerate(zip(
+            results['metadatas'],
+            results['event_ids'],
             results['distances']
         )):
             row = {
                 'rank': i + 1,
                 'event_id': event_id,
                 'title': metadata.get('title', ''),
-                'similarity_score': 1 - distance,  # Convert distance to similarity
+                # Chroma reports ip distance as 1 - dot, and the vectors
+                # are unit length, so this recovers cosine similarity
+                'similarity_score': 1 - distance,
                 'distance': distance,
-                'description_preview': doc[:500] + "..." if len(doc) > 500 else doc,
+                'description_preview': metadata.get('preview', ''),
                 'date': metadata.get('date', ''),
                 'time': metadata.get('time', ''),
                 'district': metadata.get('district', ''),
@@ -310,24 +649,38 @@ class EventEmbeddingManager:
                 'url': metadata.get('url', '')
             }
             data.append(row)
-        
-        return pd.DataFrame(data)
+
+        # Low-cardinality string columns as categories: repeated values
+        # share one allocation and comparisons run on integer codes
+        return pd.DataFrame(data).astype({
+            'district': 'category',
+            'venue': 'category',
+            'type': 'category',
+            'free': 'category',
+        })
 
 
-def create_embedding_database(df: pd.DataFrame, db_path: str = "./chroma_db") -> EventEmbeddingManager:
+def create_embedding_database(
+    df: pd.DataFrame,
+    db_path: str = "./chroma_db",
+    pca_components: Optional[int] = 128
+) -> EventEmbeddingManager:
     """
     Convenience function to create embedding database from CSV file.
-    
+
     Args:
         df: DataFrame containing event data
         db_path: Path for ChromaDB storage
-        
+        pca_components: Target dimension for the stored vectors; the
+                        384-dim MiniLM embeddings are reduced via PCA
+                        to cut per-query distance cost and index RAM
+
     Returns:
         EventEmbeddingManager instance
     """
 
     # Create manager
-    manager = EventEmbeddingManager(db_path=db_path)
+    manager = EventEmbeddingManager(db_path=db_path, pca_components=pca_components)
     
     # Add events
     manager.add_events(df)
@@ -3,18 +3,16 @@ Search page for MadLife Event Search Application.
 """
 
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
 
 # Import application modules
 from config import UI_MESSAGES
 from utils import (
-    extract_metadata_options, 
+    prepare_search_metadata,
     create_metadata_filters,
-    apply_filters_to_results,
-    apply_date_filter,
-    get_date_range_from_data,
     create_search_configuration_sidebar,
     prepare_export_data,
     initialize_session_state,
@@ -30,38 +28,64 @@ from core import (
     render_analytics_dashboard
 )
 
-from embedding_db import EventEmbeddingManager, create_embedding_database
 from apiManager import load_madrid_events_data
 
 
-@st.cache_resource
-def initialize_embedding_manager(df: pd.DataFrame):
-    """Initialize the embedding manager with caching for better performance."""
-    db_path = "./chroma_db"
-    
-    # Check if database exists
+DB_PATH = "./chroma_db"
+
+
+def _open_existing_db(db_path):
+    """Open the ChromaDB store if it already exists on disk."""
+    # Imported here so the heavy embedding stack (chromadb,
+    # sentence-transformers) loads only when this page actually runs
+    from embedding_db import EventEmbeddingManager
+
     if os.path.exists(db_path) and os.listdir(db_path):
-        # Load existing database
-        manager = EventEmbeddingManager(db_path=db_path)
-        # Show success message briefly
-        _placeholder = st.empty()
-        _placeholder.success(UI_MESSAGES['db_loaded'])
-        time.sleep(2)
-        _placeholder.empty()
+        return EventEmbeddingManager(db_path=db_path)
+    return None
+
+
+@st.cache_resource
+def initialize_search_backend():
+    """
+    Load the events data and the embedding manager.
+
+    The API fetch (network I/O) and the ChromaDB open (disk I/O) are
+    independent on cold starts, so they run concurrently and the startup
+    cost is the slower of the two instead of their sum.
+
+    Returns the DataFrame, the manager (None on failure), a status
+    string ('loaded'/'created'/'error') and the loader's error message
+    (None on success); the caller turns these into UI, because st.toast
+    is not allowed inside cached functions and the loader runs in a
+    worker thread without a ScriptRunContext.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        df_future = executor.submit(load_madrid_events_data)
+        db_future = executor.submit(_open_existing_db, DB_PATH)
+        df, load_error = df_future.result()
+        manager = db_future.result()
+
+    if manager is not None:
+        if len(df) > 0 and manager.get_collection_stats()['total_events'] == 0:
+            # The open dropped a stale store built before the filterable
+            # metadata (date_epoch etc.) existed; rebuild it in place
+            with st.spinner("Actualizando la base de datos..."):
+                manager.add_events(df)
+            status = 'created'
+        else:
+            status = 'loaded'
     elif len(df) > 0:
+        from embedding_db import create_embedding_database
+
         with st.spinner("Creando base de datos por primera vez..."):
-            manager = create_embedding_database(df, db_path)
-        
-        # Show creation success message briefly
-        _placeholder = st.empty()
-        _placeholder.success(UI_MESSAGES['db_created'])
-        time.sleep(3)
-        _placeholder.empty()
+            manager = create_embedding_database(df, DB_PATH)
+
+        status = 'created'
     else:
-        st.error(UI_MESSAGES['db_error'])
-        return None
-    
-    return manager
+        status = 'error'
+
+    return df, manager, status, load_error
 
 
 def show_search_page():
@@ -77,38 +101,53 @@ def show_search_page():
     st.title("🎭 MadLife Buscador de Eventos")
     st.markdown("Busca el evento que mejor se adapte a ti")
 
-    # Load raw data for metadata
-    raw_df = load_madrid_events_data()
-    metadata_options = extract_metadata_options(raw_df)
-    
-    # Initialize embedding manager
-    manager = initialize_embedding_manager(raw_df)
-    
+    # Load raw data and embedding manager concurrently
+    raw_df, manager, db_status, load_error = initialize_search_backend()
+
+    if load_error:
+        st.error(load_error)
+
     if manager is None:
+        st.error(UI_MESSAGES['db_error'])
         st.stop()
+
+    # Toast once per session from the script thread; auto-dismisses, so
+    # the success note costs no wall time
+    if not st.session_state.get('db_toast_shown'):
+        st.session_state['db_toast_shown'] = True
+        if db_status == 'created':
+            st.toast(UI_MESSAGES['db_created'], icon="🆕")
+        else:
+            st.toast(UI_MESSAGES['db_loaded'], icon="✅")
+
+    # Precomputed filter metadata
+    metadata_options = prepare_search_metadata(raw_df)
     
     # Database stats
     stats = manager.get_collection_stats()
     st.sidebar.metric("Número de Eventos", stats['total_events'])
     
-    # Create metadata filters
-    filters = create_metadata_filters(metadata_options)
-    
-    # Date range filter
-    min_date, max_date = get_date_range_from_data(raw_df)
-    
-    st.sidebar.markdown("### 📅 Filtrar por fecha (fecha de inicio)")
-    date_range = st.sidebar.date_input(
-        "Intervalo de fechas:",
-        value=(min_date, max_date),
-        format="DD/MM/YYYY",
-    )
-    
+    # Sidebar filters batched in a form so several edits cost one rerun
+    with st.sidebar.form("search_filters"):
+        filters = create_metadata_filters(metadata_options)
+
+        # Date range filter
+        min_date, max_date = metadata_options['date_min'], metadata_options['date_max']
+
+        st.markdown("### 📅 Filtrar por fecha (fecha de inicio)")
+        date_range = st.date_input(
+            "Intervalo de fechas:",
+            value=(min_date, max_date),
+            format="DD/MM/YYYY",
+        )
+
+        # Search configuration
+        search_config = create_search_configuration_sidebar()
+
+        st.form_submit_button("✅ Aplicar filtros", use_container_width=True)
+
     date_since, date_to = normalize_date_range(date_range)
     
-    # Search configuration
-    search_config = create_search_configuration_sidebar()
-    
     # Main content area
     col1, col2 = st.columns([2, 1])
     
@@ -131,22 +170,29 @@ def show_search_page():
         # Search execution
         if query:
             with show_loading_message():
-                # Search for similar events
+                # Every sidebar filter is pushed into the Chroma query so
+                # the index prunes them; the type value matches the
+                # type_clean metadata field stored at ingest
+                chroma_filters = {k: v for k, v in filters.items()
+                                  if k in ('district', 'venue', 'free')}
+                if 'type' in filters:
+                    chroma_filters['type_clean'] = filters['type']
+
+                # Search for similar events; the date range rides along
+                # in the where clause against the stored epoch days
                 results_df = manager.export_similar_events_df(
                     query=query,
-                    n_results=search_config['n_results']
+                    n_results=search_config['n_results'],
+                    filter_metadata=chroma_filters,
+                    date_since=date_since,
+                    date_to=date_to
                 )
-                
-                # Apply filters
-                if filters and not results_df.empty:
-                    results_df = apply_filters_to_results(results_df, filters)
-                
-                # Apply date filter
-                results_df = apply_date_filter(results_df, date_since, date_to)
-                
-                # Reset index after filtering
-                results_df.reset_index(drop=True, inplace=True)
-                results_df['rank'] = range(1, len(results_df) + 1)
+
+                if not results_df.empty:
+                    # Pre-materialize the cleaned type once for the display helpers
+                    results_df['type_clean'] = (
+                        results_df['type'].astype(str).str.rsplit('/', n=1).str[-1]
+                    )
         else:
             results_df = pd.DataFrame()  # Initialize empty DataFrame when no query
             
@@ -1,5 +1,7 @@
-import streamlit as st
 import base64
+import os
+
+import streamlit as st
 from PIL import Image
 
 
@@ -11,14 +13,23 @@ def render_svg(svg):
 
 
 @st.cache_data
-def load_resources(image_path):
+def load_resources(image_path, mtime=None):
     with open(image_path) as f:
         logo_string = f.read()
 
     logo = render_svg(logo_string)
     return logo
 
+
 @st.cache_data
 def load_image(image_path):
     img = Image.open(image_path)
-    return img
\ No newline at end of file
+    # Image.open is lazy; decode now so the cache holds decoded pixels
+    # instead of re-decoding on every draw
+    img.load()
+    return img
+
+
+def resource_version(image_path):
+    """Cache key for load_resources that changes when the file does."""
+    return os.path.getmtime(image_path)
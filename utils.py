@@ -5,86 +5,126 @@ This module contains common utility functions used across the application
 for data processing, filtering, and other helper operations.
 """
 
+import io
+
 import pandas as pd
 import streamlit as st
 from config import SEARCH_CONFIG, UI_MESSAGES
 
 
+def _sorted_unique(series):
+    """
+    Sorted unique non-empty values of a column.
+
+    Categorical columns expose their categories already unique and
+    sorted, so no Python-level sorted(set(...)) pass is needed there.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.categories
+    else:
+        values = sorted(series.dropna().unique())
+    return [v for v in values if v]
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: id})
 def extract_metadata_options(df):
     """
     Extract unique values for metadata filtering.
-    
+
+    Cached on DataFrame identity — the raw frame is a shared singleton,
+    so reruns skip the unique/sort passes.
+
     Args:
         df (pd.DataFrame): Raw data DataFrame
-        
+
     Returns:
         dict: Dictionary with metadata options for filters
     """
     if df is None or df.empty:
         return {}
-    
+
     metadata_options = {}
-    
+
     # Districts
-    districts = df['DISTRITO-INSTALACION'].dropna().unique()
-    metadata_options['districts'] = sorted([d for d in districts if d])
-    
-    # Event types
-    types = df['TIPO'].dropna().unique()
-    # Clean type names by taking the last part after '/'
-    clean_types = []
-    for t in types:
-        if t and isinstance(t, str):
-            clean_type = t.split('/')[-1] if '/' in t else t
-            clean_types.append(clean_type)
-    metadata_options['types'] = sorted(list(set(clean_types)))
-    
+    metadata_options['districts'] = _sorted_unique(df['DISTRITO-INSTALACION'])
+
+    # Event types, cleaned by taking the last part after '/'
+    tipo = df['TIPO']
+    if isinstance(tipo.dtype, pd.CategoricalDtype):
+        # Clean the unique categories instead of every row
+        clean_types = tipo.cat.categories.astype(str).str.rsplit('/', n=1).str[-1]
+    else:
+        clean_types = tipo.dropna().astype(str).str.rsplit('/', n=1).str[-1]
+    metadata_options['types'] = sorted({t for t in clean_types if t})
+
     # Free/Paid
     metadata_options['free_options'] = ['Todos', 'Gratuito', 'De pago']
-    
+
     # Venues
-    venues = df['NOMBRE-INSTALACION'].dropna().unique()
-    metadata_options['venues'] = sorted([v for v in venues if v])[:50]  # Limit to first 50
-    
+    metadata_options['venues'] = _sorted_unique(df['NOMBRE-INSTALACION'])[:50]  # Limit to first 50
+
     return metadata_options
 
 
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def prepare_search_metadata(df):
+    """
+    Precompute filter options and date bounds for the raw DataFrame.
+
+    Cached on DataFrame identity (the raw frame is itself a shared
+    singleton), so reruns pay a dictionary lookup instead of re-scanning
+    every metadata column.
+
+    Args:
+        df (pd.DataFrame): Raw data DataFrame
+
+    Returns:
+        dict: Metadata options plus 'date_min' and 'date_max' keys
+    """
+    metadata = extract_metadata_options(df)
+    metadata['date_min'], metadata['date_max'] = get_date_range_from_data(df)
+    return metadata
+
+
 def create_metadata_filters(metadata_options):
     """
-    Create sidebar filters for metadata.
-    
+    Create metadata filters in the active container.
+
+    Meant to be called inside the sidebar filter form so that edits to
+    several filters coalesce into a single rerun on submit.
+
     Args:
         metadata_options (dict): Dictionary with metadata options
-        
+
     Returns:
         dict: Dictionary with selected filter values
     """
-    st.sidebar.markdown("### 🔍 Filtros de Búsqueda")
-    
+    st.markdown("### 🔍 Filtros de Búsqueda")
+
     filters = {}
-    
+
     # District filter
     if 'districts' in metadata_options and metadata_options['districts']:
-        selected_district = st.sidebar.selectbox(
+        selected_district = st.selectbox(
             "Distrito:",
             ['Todos'] + metadata_options['districts'],
             index=0
         )
         if selected_district != 'Todos':
             filters['district'] = selected_district
-    
+
     # Event type filter
     if 'types' in metadata_options and metadata_options['types']:
-        selected_type = st.sidebar.selectbox(
+        selected_type = st.selectbox(
             "Tipo de Evento:",
             ['Todos'] + metadata_options['types'],
             index=0
         )
         if selected_type != 'Todos':
             filters['type'] = selected_type
-    
+
     # Free/Paid filter
-    free_option = st.sidebar.selectbox(
+    free_option = st.selectbox(
         "Precio:",
         metadata_options.get('free_options', ['Todos']),
         index=0
@@ -93,71 +133,31 @@ def create_metadata_filters(metadata_options):
         filters['free'] = '1'
     elif free_option == 'De pago':
         filters['free'] = '0'
-    
+
     # Venue filter
     if 'venues' in metadata_options and metadata_options['venues']:
-        selected_venue = st.sidebar.selectbox(
+        selected_venue = st.selectbox(
             "Lugar:",
             ['Todos'] + metadata_options['venues'],
             index=0
         )
         if selected_venue != 'Todos':
             filters['venue'] = selected_venue
-    
-    return filters
-
 
-def apply_filters_to_results(results_df, filters):
-    """
-    Apply metadata filters to search results.
-    
-    Args:
-        results_df (pd.DataFrame): DataFrame with search results
-        filters (dict): Dictionary with filter criteria
-        
-    Returns:
-        pd.DataFrame: Filtered results DataFrame
-    """
-    if filters and not results_df.empty:
-        for key, value in filters.items():
-            if key == 'district':
-                results_df = results_df[results_df['district'].str.contains(value, case=False, na=False)]
-            elif key == 'type':
-                results_df = results_df[results_df['type'].str.contains(value, case=False, na=False)]
-            elif key == 'free':
-                results_df = results_df[results_df['free'] == value]
-            elif key == 'venue':
-                results_df = results_df[results_df['venue'].str.contains(value, case=False, na=False)]
-    
-    return results_df
-
-
-def apply_date_filter(results_df, date_since, date_to):
-    """
-    Apply date range filter to search results.
-    
-    Args:
-        results_df (pd.DataFrame): DataFrame with search results
-        date_since (datetime): Start date for filtering
-        date_to (datetime): End date for filtering
-        
-    Returns:
-        pd.DataFrame: Filtered results DataFrame
-    """
-    dts = pd.to_datetime(date_since)
-    dto = pd.to_datetime(date_to)
-    results_df['date'] = pd.to_datetime(results_df['date'], errors='coerce')
-    filtered_df = results_df[(results_df['date'] >= dts) & (results_df['date'] <= dto)]
-    return filtered_df
+    return filters
 
 
+@st.cache_data(hash_funcs={pd.DataFrame: id})
 def get_date_range_from_data(df):
     """
     Extract min and max dates from the data for date range filter.
-    
+
+    Cached on DataFrame identity so the FECHA column is parsed once
+    per loaded frame instead of on every rerun.
+
     Args:
         df (pd.DataFrame): Raw data DataFrame
-        
+
     Returns:
         tuple: (min_date, max_date)
     """
@@ -174,22 +174,22 @@ def get_date_range_from_data(df):
 
 def create_search_configuration_sidebar():
     """
-    Create search configuration controls in sidebar.
-    
+    Create search configuration controls in the active container.
+
     Returns:
         dict: Dictionary with search configuration
     """
-    st.sidebar.markdown("### ⚙️ Configuración de Búsqueda")
-    
-    n_results = st.sidebar.slider(
-        "Número de resultados:", 
-        min_value=SEARCH_CONFIG['min_results'], 
-        max_value=SEARCH_CONFIG['max_results'], 
+    st.markdown("### ⚙️ Configuración de Búsqueda")
+
+    n_results = st.slider(
+        "Número de resultados:",
+        min_value=SEARCH_CONFIG['min_results'],
+        max_value=SEARCH_CONFIG['max_results'],
         value=SEARCH_CONFIG['default_results']
     )
-    
-    show_analytics = st.sidebar.checkbox("Mostrar dashboard de análisis", value=False)
-    
+
+    show_analytics = st.checkbox("Mostrar dashboard de análisis", value=False)
+
     return {
         'n_results': n_results,
         'show_analytics': show_analytics
@@ -199,22 +199,28 @@ def create_search_configuration_sidebar():
 def prepare_export_data(results_df):
     """
     Prepare results data for CSV export.
-    
+
+    The CSV is written straight into a binary buffer instead of being
+    materialized as an intermediate Python string, so the export payload
+    is not double-buffered before st.download_button serves it.
+
     Args:
         results_df (pd.DataFrame): DataFrame with search results
-        
+
     Returns:
-        str: CSV data as string
+        io.BytesIO: Buffer with the CSV data
     """
-    if results_df.empty:
-        return ""
-    
-    export_df = results_df[['rank', 'title', 'similarity_score', 'date', 'time', 
-                           'district', 'venue', 'type', 'free', 'url']].copy()
-    export_df.columns = ['Ranking', 'Título', 'Similitud', 'Fecha', 'Hora',
-                       'Distrito', 'Lugar', 'Tipo', 'Gratuito', 'URL']
-    
-    return export_df.to_csv(index=False, encoding='utf-8')
+    buffer = io.BytesIO()
+
+    if not results_df.empty:
+        export_df = results_df[['rank', 'title', 'similarity_score', 'date', 'time',
+                               'district', 'venue', 'type', 'free', 'url']].copy()
+        export_df.columns = ['Ranking', 'Título', 'Similitud', 'Fecha', 'Hora',
+                           'Distrito', 'Lugar', 'Tipo', 'Gratuito', 'URL']
+        export_df.to_csv(buffer, index=False, encoding='utf-8')
+        buffer.seek(0)
+
+    return buffer
 
 
 def initialize_session_state():